@@ -283,14 +283,15 @@ class Knitting_Machine:
         aligned_needle = self[self.get_aligned_needle(starting_needle, to_slider)]  # get needle on the machine.
         aligned_position = aligned_needle.racked_position_on_front(self.rack)
         xfer_loops = starting_needle.transfer_loops(aligned_needle)
+        # Both needles were resolved to the machine's bed instances, so identity excludes them without Needle.__eq__
         crossed_positions = [f for f in self.front_bed[starting_position: aligned_position + 1]
-                             if f != starting_needle and f != aligned_needle and f.has_loops]  # Only does rightward crossings. Leftward is implied
+                             if f is not starting_needle and f is not aligned_needle and f.has_loops]  # Only does rightward crossings. Leftward is implied
         for n in crossed_positions:
             for left_loop in xfer_loops:
                 for right_loop in n.held_loops:
                     self.knit_graph.add_crossing(left_loop, right_loop, Crossing_Direction.Under_Right)
         crossed_positions = [b for b in self.back_bed[starting_position: aligned_position + 1]
-                             if b != starting_needle and b != aligned_needle and b.has_loops]  # Only does rightward crossings. Leftward is implied
+                             if b is not starting_needle and b is not aligned_needle and b.has_loops]  # Only does rightward crossings. Leftward is implied
         for n in crossed_positions:
             for left_loop in xfer_loops:
                 for right_loop in n.held_loops:
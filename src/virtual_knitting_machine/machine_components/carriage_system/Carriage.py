@@ -97,6 +97,16 @@ class Carriage:
         assert len(directions) > 0, f"Carriage must have at least 1 direction option."
         return directions
 
+    def can_move_in_direction(self, direction: Carriage_Pass_Direction) -> bool:
+        """
+        :param direction: Direction to test.
+        :return: True if the carriage can move in the given direction from this position.
+        """
+        if direction is Carriage_Pass_Direction.Leftward:
+            return not self.on_left_side
+        else:
+            return not self.on_right_side
+
     def left_of(self, needle_position: int) -> bool:
         """
         :param needle_position: Position to compare to.
@@ -136,7 +146,7 @@ class Carriage:
         :param direction: Direction to move the carriage in.
         :param end_position: The position to move the carriage to.
         """
-        if direction not in self.possible_directions():
+        if not self.can_move_in_direction(direction):
             warnings.warn(Carriage_Return_Warning(self, self.current_needle_position, end_position, direction))
             # raise Carriage_Cannot_Move_In_Direction(self, direction)
         direction_to_position = self.direction_to(end_position)
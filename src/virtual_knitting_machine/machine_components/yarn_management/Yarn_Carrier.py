@@ -13,6 +13,7 @@ class Yarn_Carrier:
     """
         Carrier on a knitting machine
     """
+    __slots__ = ("_carrier_id", "_is_active", "_is_hooked", "_position", "_yarn")
 
     def __init__(self, carrier_id: int, yarn: None | Machine_Knit_Yarn = None, yarn_properties: Yarn_Properties | None = None):
         self._carrier_id: int = carrier_id
@@ -16,20 +16,37 @@ class Yarn_Carrier_Set:
     Attributes
     ----------
     """
+    __slots__ = ("_carrier_ids", "_carrier_id_set", "_len", "_many_carriers", "_hash", "_str", "_dat_id")
+    _carrier_ids: tuple[int, ...]
+    _carrier_id_set: frozenset[int]
+    _len: int
+    _many_carriers: bool
+    _hash: int
+    _str: str | None
+    _dat_id: int | None
 
     def __init__(self, carrier_ids: list[int]):
         """
         Represents the state of the yarn_carriage
         :param carrier_ids: The carrier_id for this yarn
         """
-        duplicates = set()
-        self._carrier_ids = []
-        for c in carrier_ids:
-            if c in duplicates:
-                warnings.warn(Duplicate_Carriers_In_Set(c, carrier_ids))
-            else:
-                duplicates.add(c)
-                self._carrier_ids.append(c)
+        self._carrier_ids = tuple(dict.fromkeys(carrier_ids))
+        self._len = len(self._carrier_ids)
+        self._many_carriers = self._len > 1
+        if self._len != len(carrier_ids):  # only scan for the duplicates to warn about when there are some
+            duplicates = set()
+            for c in carrier_ids:
+                if c in duplicates:
+                    warnings.warn(Duplicate_Carriers_In_Set(c, carrier_ids))
+                else:
+                    duplicates.add(c)
+        self._carrier_id_set = frozenset(self._carrier_ids)
+        if self._len == 1:
+            self._hash = self._carrier_ids[0]
+        else:
+            self._hash = hash(self._carrier_ids)
+        self._str = None
+        self._dat_id = None
 
     #todo: Add position property to get position of the carrier set
 
@@ -38,7 +55,7 @@ class Yarn_Carrier_Set:
         :param carrier_system: carrier system referenced by set
         :return: carriers that correspond to the ids in the carrier set
         """
-        return [carrier_system[cid] for cid in self.carrier_ids]
+        return [carrier_system[cid] for cid in self._carrier_ids]
 
     def position_carriers(self, carrier_system, position: Needle | int | None):
         """
@@ -46,13 +63,12 @@ class Yarn_Carrier_Set:
         :param carrier_system: Carrier system referenced by set.
         :param position: The position to move the carrier set to. If None, this means the carrier is not active.
         """
-        for carrier in self.get_carriers(carrier_system):
-            carrier.position = position
+        carrier_system.position_carriers(self._carrier_ids, position)
 
     @property
-    def carrier_ids(self) -> list[int]:
+    def carrier_ids(self) -> tuple[int, ...]:
         """
-        :return: the id of this carrier
+        :return: the ids of the carriers in this set
         """
         return self._carrier_ids
 
@@ -61,50 +77,55 @@ class Yarn_Carrier_Set:
         """
         :return: True if this carrier set involves multiple carriers
         """
-        return len(self.carrier_ids) > 1
+        return self._many_carriers
 
     def __str__(self):
-        carriers = str(self.carrier_ids[0])
-        for cid in self.carrier_ids[1:]:
-            carriers += f" {cid}"
-        return carriers
+        if self._str is None:
+            self._str = " ".join(str(c) for c in self._carrier_ids)
+        return self._str
 
     def __hash__(self):
-        if len(self.carrier_ids) == 1:
-            return self.carrier_ids[0]
-        else:
-            return hash(str(self))
+        return self._hash
 
     def __repr__(self):
         return str(self)
 
     def __eq__(self, other):
-        if other is None:
-            return False
-        for c, other_c in zip(self.carrier_ids, other.carrier_ids):
-            if c != other_c:
+        if other is self:
+            return True
+        elif type(other) is int:  # a single carrier set is equal to its carrier id, matching its hash
+            return self._len == 1 and self._carrier_ids[0] == other
+        elif isinstance(other, Yarn_Carrier_Set):
+            return self._carrier_ids == other._carrier_ids
+        elif type(other) is list or type(other) is tuple:
+            if len(other) != self._len:
                 return False
-        return True
+            for c, other_c in zip(self._carrier_ids, other):
+                if c != (other_c if type(other_c) is int else int(other_c)):  # only coerce carriers, not ids
+                    return False
+            return True
+        else:
+            return False
 
     def __iter__(self):
-        return iter(self.carrier_ids)
+        return iter(self._carrier_ids)
 
     def __getitem__(self, item: int | slice):
-        return self.carrier_ids[item]
+        return self._carrier_ids[item]
 
     def __len__(self):
-        return len(self.carrier_ids)
+        return self._len
 
     def __contains__(self, carrier_id: int):
-        return carrier_id in self.carrier_ids
+        return carrier_id in self._carrier_id_set
 
     def carrier_DAT_ID(self) -> int:
         """
         :return: Number used in DAT files to represent the carrier set
         """
-        carrier_id = 0
-        for place, carrier in enumerate(reversed(self.carrier_ids)):
-            multiplier = 10 ** place
-            carrier_val = multiplier * carrier
-            carrier_id += carrier_val
-        return carrier_id
+        if self._dat_id is None:
+            carrier_id = 0
+            for carrier in self._carrier_ids:
+                carrier_id = carrier_id * 10 + carrier
+            self._dat_id = carrier_id
+        return self._dat_id
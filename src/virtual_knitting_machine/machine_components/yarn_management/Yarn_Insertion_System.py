@@ -1,10 +1,12 @@
 """A module containing Yarn Insertion System classes."""
+import sys
 import warnings
+from itertools import chain
 
 from knit_graphs.Knit_Graph import Knit_Graph
 
 from virtual_knitting_machine.knitting_machine_exceptions.Yarn_Carrier_Error_State import Inserting_Hook_In_Use_Exception, Hooked_Carrier_Exception, Use_Inactive_Carrier_Exception
-from virtual_knitting_machine.knitting_machine_warnings.Yarn_Carrier_System_Warning import In_Active_Carrier_Warning, In_Loose_Carrier_Warning, Out_Inactive_Carrier_Warning
+from virtual_knitting_machine.knitting_machine_warnings.Yarn_Carrier_System_Warning import In_Loose_Carrier_Warning
 from virtual_knitting_machine.machine_components.carriage_system.Carriage_Pass_Direction import Carriage_Pass_Direction
 from virtual_knitting_machine.machine_components.needles.Needle import Needle
 from virtual_knitting_machine.machine_components.yarn_management.Yarn_Carrier import Yarn_Carrier
@@ -14,12 +16,16 @@ from virtual_knitting_machine.machine_constructed_knit_graph.Machine_Knit_Loop i
 
 class Yarn_Insertion_System:
     """A class for managing the state of the Yarn-Insertion system of yarn carriers on the knitting machine."""
+    __slots__ = ("knitting_machine", "carriers", "_carrier_ids", "_carrier_id_set", "_hook_position", "hook_input_direction", "_searching_for_position", "hooked_carrier")
     Hook_Size = 5
+    Inactive_Hook_Position = sys.maxsize  # Stands in for a None hook position. No needle is within a hook's size of it.
 
     def __init__(self, knitting_machine, carrier_count: int = 10):
         self.knitting_machine = knitting_machine
         self.carriers: list[Yarn_Carrier] = [Yarn_Carrier(i) for i in range(1, carrier_count + 1)]
-        self.hook_position: None | int = None
+        self._carrier_ids: tuple[int, ...] = tuple(c.carrier_id for c in self.carriers)  # carriers are fixed at construction
+        self._carrier_id_set: frozenset[int] = frozenset(self._carrier_ids)
+        self._hook_position: int = Yarn_Insertion_System.Inactive_Hook_Position
         self.hook_input_direction: None | Carriage_Pass_Direction = None
         self._searching_for_position: bool = False
         self.hooked_carrier: Yarn_Carrier | None = None
@@ -34,11 +40,27 @@ class Yarn_Insertion_System:
         return self._searching_for_position
 
     @property
-    def carrier_ids(self) -> list[int]:
+    def hook_position(self) -> int | None:
         """
-        :return: List of carrier ids in the carrier system.
+        :return: The needle position of the inserting hook or None if the hook is not at a position.
         """
-        return [int(c) for c in self.carriers]
+        if self._hook_position == Yarn_Insertion_System.Inactive_Hook_Position:
+            return None
+        return self._hook_position
+
+    @hook_position.setter
+    def hook_position(self, position: int | None):
+        if position is None:
+            self._hook_position = Yarn_Insertion_System.Inactive_Hook_Position
+        else:
+            self._hook_position = position
+
+    @property
+    def carrier_ids(self) -> tuple[int, ...]:
+        """
+        :return: The carrier ids in the carrier system.
+        """
+        return self._carrier_ids
 
     def position_carrier(self, carrier_id: int, position: int | Needle):
         """
@@ -48,6 +70,17 @@ class Yarn_Insertion_System:
         """
         self[carrier_id].position = position
 
+    def position_carriers(self, carrier_ids: list[int] | tuple[int, ...], position: int | Needle | None):
+        """
+        Update the position of each of the given carriers.
+        :param carrier_ids: The carriers to update
+        :param position: the position of the carriers. If None, the carriers are not active.
+        """
+        if position is not None:
+            position = int(position)  # resolve the needle position once for all carriers
+        for carrier_id in carrier_ids:
+            self[carrier_id].position = position
+
     @property
     def hook_size(self) -> int:
         """
@@ -75,14 +108,12 @@ class Yarn_Insertion_System:
         :param needle: the needle to check for compliance
         :return: True if inserting hook is conflicting with needle
         """
-        if self.hook_position is not None:  # reserve positions to right of needle
-            if direction is Carriage_Pass_Direction.Leftward:
-                inserting_hook_range = range(self.hook_position + 1, self.hook_position + self.hook_size)
-            else:
-                inserting_hook_range = range(self.hook_position - 1, self.hook_position - self.hook_size)
-            return needle.position in inserting_hook_range
-        else:  # no conflicts if hook is not active
-            return False
+        # reserve positions to right of needle. An inactive hook sits at the sentinel position, so no needle falls in its range.
+        if direction is Carriage_Pass_Direction.Leftward:
+            inserting_hook_range = range(self._hook_position + 1, self._hook_position + self.hook_size)
+        else:
+            inserting_hook_range = range(self._hook_position - 1, self._hook_position - self.hook_size)
+        return needle.position in inserting_hook_range
 
     def missing_carriers(self, carrier_ids: list[int]) -> list[int]:
         """
@@ -97,9 +128,7 @@ class Yarn_Insertion_System:
         :return: True if the carrier (all carriers in set) are active (not-on the gripper)
             Note: If an empty list of carriers is given, this will return true because the empty set is active.
         """
-        if len(carrier_ids) == 0:
-            return True  # No ids given, so the null set is active
-        return len(self.missing_carriers(carrier_ids)) == 0
+        return all(self[cid].is_active for cid in carrier_ids)  # all() of no ids is True, so the null set is active
 
     def yarn_is_loose(self, carrier_id: int) -> bool:
         """
@@ -114,11 +143,9 @@ class Yarn_Insertion_System:
         :param carrier_id:
         """
         carrier = self[carrier_id]
-        if carrier.is_active:
-            warnings.warn(In_Active_Carrier_Warning(carrier_id))
         if carrier.yarn.last_needle() is None:
             warnings.warn(In_Loose_Carrier_Warning(carrier_id))
-        carrier.bring_in()
+        carrier.bring_in()  # carrier warns if it is already active
 
     def inhook(self, carrier_id: int):
         """
@@ -127,14 +154,12 @@ class Yarn_Insertion_System:
         """
 
         carrier = self[carrier_id]
-        if carrier.is_active:
-            warnings.warn(In_Active_Carrier_Warning(carrier_id))
         if not self.inserting_hook_available:
             raise Inserting_Hook_In_Use_Exception(carrier_id)
         self.hooked_carrier = carrier
         self._searching_for_position = True
         self.hook_position = None
-        self.hooked_carrier.inhook()
+        self.hooked_carrier.inhook()  # carrier warns if it is already active
 
     def releasehook(self):
         """
@@ -152,11 +177,9 @@ class Yarn_Insertion_System:
         :param carrier_id:
         """
         carrier = self[carrier_id]
-        if not carrier.is_active:
-            warnings.warn(Out_Inactive_Carrier_Warning(carrier_id))
         if carrier.is_hooked:
             raise Hooked_Carrier_Exception(carrier_id)
-        carrier.out()
+        carrier.out()  # carrier warns if it is not active
 
     def outhook(self, carrier_id: int):
         """
@@ -165,23 +188,18 @@ class Yarn_Insertion_System:
         :param carrier_id:
         """
         carrier = self[carrier_id]
-        if not carrier.is_active:
-            warnings.warn(Out_Inactive_Carrier_Warning(carrier_id))
         if not self.inserting_hook_available:
             Inserting_Hook_In_Use_Exception(carrier_id)
         if carrier.is_hooked:
             raise Hooked_Carrier_Exception(carrier_id)
-        carrier.outhook()
+        carrier.outhook()  # carrier warns if it is not active
 
     def active_floats(self) -> dict[Machine_Knit_Loop, Machine_Knit_Loop]:
         """
         :return: Dictionary of loops that are active keyed to active yarn-wise neighbors.
          Each key-value pair represents a directed float where k comes before v on the yarns in the system.
         """
-        active_floats = {}
-        for carrier in self.carriers:
-            active_floats.update(carrier.yarn.active_floats())
-        return active_floats
+        return dict(chain.from_iterable(carrier.yarn.active_floats().items() for carrier in self.carriers))
 
     def make_loops(self, carrier_ids: list[int] | Yarn_Carrier_Set, needle: Needle, knit_graph: Knit_Graph, direction: Carriage_Pass_Direction) -> list[Machine_Knit_Loop]:
         """
@@ -191,36 +209,51 @@ class Yarn_Insertion_System:
         :param knit_graph: The knit Graph being constructed
         :return: The set of loops made on this machine.
         """
-        needle = self.knitting_machine[needle]
+        knitting_machine = self.knitting_machine
+        needle = knitting_machine[needle]
         if self.searching_for_position:  # mark inserting hook position
             self.hook_position = needle.position
             self.hook_input_direction = direction
             self._searching_for_position = False
-            self.knitting_machine.carriage.move_to(self.hook_position)
+            knitting_machine.carriage.move_to(self.hook_position)
         loops = []
+        floated_bed_slices: dict[tuple[int, int], tuple[list[Needle], list[Needle]]] = {}  # carriers in a set usually float over the same range
         for cid in carrier_ids:
             carrier = self[cid]
             if not carrier.is_active:
                 raise Use_Inactive_Carrier_Exception(cid)
-            float_source_needle = carrier.yarn.last_needle()
-            loop = carrier.yarn.make_loop_on_needle(knit_graph=knit_graph, holding_needle=needle)
+            yarn = carrier.yarn
+            float_source_needle = yarn.last_needle()
+            loop = yarn.make_loop_on_needle(knit_graph=knit_graph, holding_needle=needle)
             if float_source_needle is not None:
-                float_source_needle = self.knitting_machine[float_source_needle]
-                float_start = min(float_source_needle.position, needle.position)
-                float_end = max(float_source_needle.position, needle.position)
-                front_floated_needles = [f for f in self.knitting_machine.front_bed[float_start: float_end + 1]
-                                         if f != float_source_needle and f != needle]
-                back_floated_needles = [b for b in self.knitting_machine.back_bed[float_start: float_end + 1]
-                                        if b != float_source_needle and b != needle]
+                float_source_needle = knitting_machine[float_source_needle]
+                if float_source_needle.position == needle.position and float_source_needle.is_front != needle.is_front and not float_source_needle.is_slider:
+                    loops.append(loop)  # float crosses between opposite needles, so the only needles it could pass are its own ends
+                    continue
+                if float_source_needle.position < needle.position:
+                    float_start, float_end = float_source_needle.position, needle.position
+                else:
+                    float_start, float_end = needle.position, float_source_needle.position
+                bed_slices = floated_bed_slices.get((float_start, float_end))
+                if bed_slices is None:
+                    bed_slices = (knitting_machine.front_bed[float_start: float_end + 1], knitting_machine.back_bed[float_start: float_end + 1])
+                    floated_bed_slices[(float_start, float_end)] = bed_slices
+                front_slice, back_slice = bed_slices
+                # Bed needles are unique instances, so identity excludes the float's end needles without Needle.__eq__
+                front_floated_loops = [fl for f in front_slice
+                                       if f is not float_source_needle and f is not needle for fl in f.held_loops]
+                back_floated_loops = [bl for b in back_slice
+                                      if b is not float_source_needle and b is not needle for bl in b.held_loops]
                 for float_source_loop in float_source_needle.held_loops:
-                    for fn in front_floated_needles:
-                        for fl in fn.held_loops:
-                            carrier.yarn.add_loop_in_front_of_float(fl, float_source_loop, loop)
-                    for bn in back_floated_needles:
-                        for bl in bn.held_loops:
-                            carrier.yarn.add_loop_behind_float(bl, float_source_loop, loop)
+                    for fl in front_floated_loops:
+                        yarn.add_loop_in_front_of_float(fl, float_source_loop, loop)
+                    for bl in back_floated_loops:
+                        yarn.add_loop_behind_float(bl, float_source_loop, loop)
             loops.append(loop)
         return loops
 
+    def __contains__(self, carrier_id: int | Yarn_Carrier) -> bool:
+        return int(carrier_id) in self._carrier_id_set
+
     def __getitem__(self, item: int) -> Yarn_Carrier:
         return self.carriers[item - 1]  # Carriers are given from values starting at 1 but indexed in the list starting at zero
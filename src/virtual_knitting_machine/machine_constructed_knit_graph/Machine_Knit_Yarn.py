@@ -59,29 +59,32 @@ class Machine_Knit_Yarn(Yarn):
 
     @property
     def last_loop(self) -> Machine_Knit_Loop | None:
-        assert isinstance(self._last_loop, Machine_Knit_Loop)
+        """
+        :return: The loop at the end of the yarn or None if no loops have been made on the yarn.
+        """
         return self._last_loop
 
     def last_needle(self) -> Needle | None:
         """
         :return: The needle that holds the loop closest to the end of the yarn or None if the yarn has been dropped entirely
         """
-        if self.last_loop is None:
+        last_loop = self._last_loop
+        if last_loop is None:
             return None
-        return self.last_loop.holding_needle
+        return last_loop.needle_history[-1]  # inlines Machine_Knit_Loop.holding_needle, which is None once the loop is dropped
 
     def active_floats(self) -> dict[Machine_Knit_Loop, Machine_Knit_Loop]:
         """
         :return: Dictionary of loops that are active keyed to active yarn-wise neighbors.
          Each key-value pair represents a directed float where k comes before v on the yarn.
         """
+        active_loops = self.active_loops
+        successors = self.loop_graph.succ  # read the yarn's adjacency directly instead of next_loop's checked copy
         floats = {}
-        for l in self.active_loops:
-            assert isinstance(l, Machine_Knit_Loop)
-            n = self.next_loop(l)
-            if n is not None and n in self.active_loops:
-                assert isinstance(n, Machine_Knit_Loop)
-                floats[l] = n
+        for l in active_loops:
+            for n in successors[l]:  # a yarn is a single path, so each loop has at most one successor
+                if n in active_loops:
+                    floats[l] = n
         return floats
 
     def make_loop_on_needle(self, holding_needle: Needle, knit_graph=None) -> Machine_Knit_Loop: